@@ -0,0 +1,334 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+CACHE_FILE = ".nessus_convert_cache.{output_format}.json"
+SUMMARY_FILE = "severity_summary.txt"
+
+
+def run(output_format, write_output, watch=False, interval=5.0):
+    """
+    Converts .nessus files in the current directory with write_output, once or continuously.
+    """
+    summary = {}
+
+    if not watch:
+        # Get all .nessus files in the current directory
+        nessus_files = list_nessus_files()
+
+        if not nessus_files:
+            print("No .nessus files found in the current directory.")
+            return
+
+        process_files(nessus_files, summary, output_format, write_output)
+        return
+
+    print(f"Watching the current directory for .nessus files every {interval}s (Ctrl+C to stop)...")
+    previous = {}
+    handled = {}
+    try:
+        while True:
+            current = snapshot_nessus_files()
+
+            # Only pick up files whose size and mtime held steady for a full interval,
+            # so scans still being written by the downloader are left alone.
+            ready = [f for f, sig in current.items() if handled.get(f) != sig and previous.get(f) == sig]
+
+            # Forget files that were deleted or renamed away since the last poll
+            handled = {f: sig for f, sig in handled.items() if f in current}
+            stale = [f for f in summary if f not in current]
+            for nessus_file in stale:
+                del summary[nessus_file]
+
+            if ready:
+                final_names = process_files(ready, summary, output_format, write_output)
+                for nessus_file, final_name in final_names.items():
+                    handled[nessus_file] = current[nessus_file]
+                    # Mark the renamed file as handled so it is not re-hashed next poll
+                    if final_name != nessus_file:
+                        handled[final_name] = file_signature(final_name)
+            elif stale:
+                write_summary(summary)
+
+            previous = current
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("Stopping watch mode.")
+
+
+def list_nessus_files():
+    """Return the .nessus files in the current directory."""
+    return [f for f in os.listdir('.') if f.endswith('.nessus')]
+
+
+def snapshot_nessus_files():
+    """Map each .nessus file in the current directory to its (mtime, size) signature."""
+    snapshot = {}
+    for nessus_file in list_nessus_files():
+        signature = file_signature(nessus_file)
+        if signature:
+            snapshot[nessus_file] = signature
+    return snapshot
+
+
+def file_signature(file_name):
+    """Return a file's (mtime, size) signature, or None if it does not exist."""
+    try:
+        stat = os.stat(file_name)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def process_files(nessus_files, summary, output_format, write_output):
+    """Convert each file, rewrite the severity summary and return each file's final name."""
+    final_names = {}
+    for nessus_file in nessus_files:
+        final_names[nessus_file] = nessus_file
+        try:
+            final_name, severity_counts = convert_file(nessus_file, output_format, write_output)
+            final_names[nessus_file] = final_name
+            summary.pop(nessus_file, None)
+            summary[final_name] = severity_counts
+        except Exception as e:
+            print(f"Error processing {nessus_file}: {e}")
+
+    write_summary(summary)
+    return final_names
+
+
+def convert_file(nessus_file, output_format, write_output):
+    """Convert a single .nessus file unless its own output is already up to date."""
+    digest = hash_file(nessus_file)
+    cached = cached_entry(load_cache(output_format), digest)
+    if cached:
+        # Re-downloaded copies get the same timestamped name, replacing the earlier copy
+        if cached["timestamp_prefix"]:
+            nessus_file = rename_file_if_needed(nessus_file, cached["timestamp_prefix"])
+
+        # Only skip when this file's output still holds what was written for this digest
+        output_file = output_name(nessus_file, output_format)
+        output_sig = cached["outputs"].get(output_file)
+        if isinstance(output_sig, list) and file_signature(output_file) == tuple(output_sig):
+            print(f"Skipping {nessus_file}: unchanged since it was converted to {output_file}")
+            return nessus_file, cached["severity_counts"]
+
+    # Parse the file for timestamp and vulnerabilities
+    print(f"Processing {nessus_file}...")
+    parsed_data, severity_counts, timestamp_prefix = parse_nessus_file(nessus_file)
+
+    # Rename the file if needed
+    if timestamp_prefix:
+        nessus_file = rename_file_if_needed(nessus_file, timestamp_prefix)
+
+    output_file = output_name(nessus_file, output_format)
+    write_output(parsed_data, output_file)
+
+    print(f"Successfully converted {nessus_file} to {output_file}")
+    record_conversion(output_format, digest, output_file, severity_counts, timestamp_prefix)
+    return nessus_file, severity_counts
+
+
+def output_name(nessus_file, output_format):
+    """Return the output file name for a .nessus file."""
+    return f"{os.path.splitext(nessus_file)[0]}.{output_format}"
+
+
+def write_summary(summary):
+    """Write the severity counts for every converted file to the summary file."""
+    summary_lines = []
+    for nessus_file, severity_counts in summary.items():
+        summary_lines.append(f"{nessus_file}:")
+        summary_lines.append(f"  Low: {severity_counts['low']}")
+        summary_lines.append(f"  Medium: {severity_counts['medium']}")
+        summary_lines.append(f"  High: {severity_counts['high']}")
+        summary_lines.append(f"  Critical: {severity_counts['critical']}\n")
+
+    with open(SUMMARY_FILE, 'w', encoding='utf-8') as sf:
+        sf.writelines('\n'.join(summary_lines))
+    print(f"Severity summary written to {SUMMARY_FILE}")
+
+
+def parse_nessus_file(nessus_file):
+    """Parse a .nessus file and extract all vulnerability data and the HOST_END timestamp."""
+    try:
+        tree = ET.parse(nessus_file)
+        root = tree.getroot()
+
+        all_data = []
+        severity_counts = {"low": 0, "medium": 0, "high": 0, "critical": 0}
+        timestamp_prefix = None
+
+        # Process each ReportHost
+        for report_host in root.iter('ReportHost'):
+            host_data = {
+                "ip_address": report_host.get('name'),
+                "host_properties": parse_host_properties(report_host),
+                "vulnerabilities": []
+            }
+
+            # Get the HOST_END timestamp and format it
+            host_end = host_data["host_properties"].get("HOST_END")
+            if host_end and not timestamp_prefix:
+                timestamp_prefix = format_timestamp(host_end)
+
+            # Extract all data from each ReportItem
+            for report_item in report_host.iter('ReportItem'):
+                severity = int(report_item.get('severity', '0'))  # Default to 0 if missing
+
+                # Update severity counts
+                if severity == 0:  # Skip informational items
+                    continue
+                elif severity == 1:
+                    severity_counts["low"] += 1
+                elif severity == 2:
+                    severity_counts["medium"] += 1
+                elif severity == 3:
+                    severity_counts["high"] += 1
+                elif severity == 4:
+                    severity_counts["critical"] += 1
+
+                vuln_data = {
+                    **report_item.attrib,  # Include all attributes as top-level fields
+                    **extract_nested_fields(report_item)  # Include all nested elements
+                }
+                host_data["vulnerabilities"].append(vuln_data)
+
+            # Add host data only if it has vulnerabilities
+            if host_data["vulnerabilities"]:
+                all_data.append(host_data)
+
+        return all_data, severity_counts, timestamp_prefix
+
+    except ET.ParseError as e:
+        raise ValueError(f"Error parsing .nessus file: {e}")
+
+
+def rename_file_if_needed(file_name, timestamp_prefix):
+    """Rename the file if it is not correctly timestamped or has redundant timestamps."""
+    if is_timestamped(file_name):
+        print(f"{file_name} already follows the timestamped naming convention.")
+        return file_name
+
+    # Strip redundant timestamps before renaming
+    clean_name = file_name
+    while True:
+        parts = clean_name.split('_', 4)
+        try:
+            datetime.strptime("_".join(parts[:4]), "%Y_%B_%d_%H%M%S")
+            clean_name = "_".join(parts[4:])  # Remove the first valid timestamp
+        except (ValueError, IndexError):
+            break
+
+    new_name = f"{timestamp_prefix}_{clean_name}"
+    os.rename(file_name, new_name)
+    print(f"Renamed {file_name} to {new_name}")
+    return new_name
+
+
+def is_timestamped(file_name):
+    """Check if the file name starts with a valid timestamp and avoids duplicates."""
+    try:
+        parts = file_name.split('_', 4)
+        if len(parts) < 5:
+            return False
+
+        datetime.strptime("_".join(parts[:4]), "%Y_%B_%d_%H%M%S")
+        remaining_name = "_".join(parts[4:])
+        redundant_timestamp = "_".join(parts[:4]) in remaining_name
+        return not redundant_timestamp
+    except (ValueError, IndexError):
+        return False
+
+
+def hash_file(file_name):
+    """Return the SHA-256 hex digest of a file's contents."""
+    sha256 = hashlib.sha256()
+    with open(file_name, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def load_cache(output_format):
+    """Load the content-hash cache, treating a missing or unreadable cache as empty."""
+    try:
+        with open(CACHE_FILE.format(output_format=output_format), 'r', encoding='utf-8') as cf:
+            cache = json.load(cf)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def cached_entry(cache, digest):
+    """Return the cache entry for a digest, or None if it is missing or malformed."""
+    entry = cache.get(digest)
+    if not isinstance(entry, dict):
+        return None
+    if not isinstance(entry.get("outputs"), dict) or not isinstance(entry.get("severity_counts"), dict):
+        return None
+    entry.setdefault("timestamp_prefix", None)
+    return entry
+
+
+def record_conversion(output_format, digest, output_file, severity_counts, timestamp_prefix):
+    """Record a finished conversion in the content-hash cache."""
+    # Each output format has its own cache file, so the JSON and YAML converters never
+    # write the same cache. Run one watcher per format on a folder.
+    cache_file = CACHE_FILE.format(output_format=output_format)
+    cache = load_cache(output_format)
+    entry = cached_entry(cache, digest) or {"outputs": {}}
+    entry["timestamp_prefix"] = timestamp_prefix
+    entry["severity_counts"] = severity_counts
+    entry["outputs"][output_file] = file_signature(output_file)
+    cache[digest] = entry
+
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir='.', prefix=f"{cache_file}.",
+                                     suffix='.tmp', delete=False) as cf:
+        temp_file = cf.name
+        try:
+            json.dump(cache, cf, indent=4)
+        except Exception:
+            cf.close()
+            os.unlink(temp_file)
+            raise
+    os.replace(temp_file, cache_file)
+
+
+def parse_host_properties(report_host):
+    """Extract host properties from ReportHost."""
+    host_properties = {}
+    properties_element = report_host.find('HostProperties')
+    if properties_element is not None:
+        for tag in properties_element:
+            host_properties[tag.attrib.get('name', tag.tag)] = tag.text.strip() if tag.text else None
+    return host_properties
+
+
+def extract_nested_fields(report_item):
+    """Extract all nested fields from a ReportItem."""
+    nested_fields = {}
+    for child in report_item:
+        # Handle nested text fields
+        if child.tag not in nested_fields:
+            nested_fields[child.tag] = child.text.strip() if child.text else None
+        else:
+            # Handle duplicate tags as lists
+            if not isinstance(nested_fields[child.tag], list):
+                nested_fields[child.tag] = [nested_fields[child.tag]]
+            nested_fields[child.tag].append(child.text.strip() if child.text else None)
+
+    return nested_fields
+
+
+def format_timestamp(timestamp):
+    """Format the HOST_END timestamp as 'YYYY_MONTH_DD_TIME'."""
+    try:
+        dt = datetime.strptime(timestamp, "%a %b %d %H:%M:%S %Y")
+        return dt.strftime("%Y_%B_%d_%H%M%S")
+    except ValueError:
+        return None
@@ -0,0 +1,112 @@
+import os
+import sys
+import json
+import shutil
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'converters'))
+
+import nessus_converter  # noqa: E402
+
+TIMESTAMP = "2025_January_23_025706"
+SCAN = """<NessusClientData_v2><Report><ReportHost name="10.0.0.1">
+<HostProperties><tag name="HOST_END">Thu Jan 23 02:57:06 2025</tag></HostProperties>
+<ReportItem severity="3" pluginID="1"><description>x</description></ReportItem>
+</ReportHost></Report></NessusClientData_v2>"""
+
+
+class CountingWriter:
+    """Writes JSON output and counts how often it was asked to."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, parsed_data, output_file):
+        self.calls += 1
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(parsed_data, f)
+
+
+@pytest.fixture
+def scan_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "scan.nessus").write_text(SCAN, encoding='utf-8')
+    return tmp_path
+
+
+def test_is_timestamped():
+    assert nessus_converter.is_timestamped(f"{TIMESTAMP}_scan.nessus")
+    assert not nessus_converter.is_timestamped("scan.nessus")
+    assert not nessus_converter.is_timestamped(f"{TIMESTAMP}_{TIMESTAMP}_scan.nessus")
+
+
+def test_convert_renames_and_second_run_skips(scan_dir):
+    writer = CountingWriter()
+    name, counts = nessus_converter.convert_file("scan.nessus", "json", writer)
+    assert name == f"{TIMESTAMP}_scan.nessus"
+    assert counts["high"] == 1
+    assert (scan_dir / f"{TIMESTAMP}_scan.json").exists()
+
+    assert nessus_converter.convert_file(name, "json", writer) == (name, counts)
+    assert writer.calls == 1
+
+
+def test_timestamped_file_is_not_renamed_again(scan_dir):
+    os.rename("scan.nessus", f"{TIMESTAMP}_scan.nessus")
+    name, _ = nessus_converter.convert_file(f"{TIMESTAMP}_scan.nessus", "json", CountingWriter())
+    assert name == f"{TIMESTAMP}_scan.nessus"
+
+
+def test_changed_output_is_regenerated(scan_dir):
+    writer = CountingWriter()
+    name, _ = nessus_converter.convert_file("scan.nessus", "json", writer)
+    (scan_dir / f"{TIMESTAMP}_scan.json").write_text("[]", encoding='utf-8')
+
+    nessus_converter.convert_file(name, "json", writer)
+    assert writer.calls == 2
+    assert (scan_dir / f"{TIMESTAMP}_scan.json").read_text(encoding='utf-8') != "[]"
+
+
+def test_copied_file_gets_its_own_output(scan_dir):
+    writer = CountingWriter()
+    nessus_converter.convert_file("scan.nessus", "json", writer)
+    shutil.copy(f"{TIMESTAMP}_scan.nessus", "other.nessus")
+
+    name, _ = nessus_converter.convert_file("other.nessus", "json", writer)
+    assert name == f"{TIMESTAMP}_other.nessus"
+    assert (scan_dir / f"{TIMESTAMP}_other.json").exists()
+    assert writer.calls == 2
+
+
+def test_redownloaded_copy_replaces_timestamped_file(scan_dir):
+    writer = CountingWriter()
+    nessus_converter.convert_file("scan.nessus", "json", writer)
+    (scan_dir / "scan.nessus").write_text(SCAN, encoding='utf-8')
+
+    name, _ = nessus_converter.convert_file("scan.nessus", "json", writer)
+    assert name == f"{TIMESTAMP}_scan.nessus"
+    assert sorted(nessus_converter.list_nessus_files()) == [name]
+    assert writer.calls == 1
+
+
+def test_malformed_cache_entry_is_a_miss(scan_dir):
+    digest = nessus_converter.hash_file("scan.nessus")
+    cache = {digest: {"outputs": {f"{TIMESTAMP}_scan.json": None}, "severity_counts": {}}, "bad": None}
+    with open(nessus_converter.CACHE_FILE.format(output_format="json"), 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+
+    writer = CountingWriter()
+    nessus_converter.convert_file("scan.nessus", "json", writer)
+    assert writer.calls == 1
+
+
+def test_formats_use_separate_caches(scan_dir):
+    name, _ = nessus_converter.convert_file("scan.nessus", "json", CountingWriter())
+    writer = CountingWriter()
+    nessus_converter.convert_file(name, "yml", writer)
+    assert writer.calls == 1
+    assert sorted(f for f in os.listdir('.') if f.startswith(".nessus_convert_cache")) == [
+        ".nessus_convert_cache.json.json",
+        ".nessus_convert_cache.yml.json",
+    ]